@@ -20,15 +20,222 @@
 
 
 # standard library imports
+import array
 import os
 import random
-import time
-import threading
+import sys
 
 # third-party imports
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+from gi.repository import GLib, GObject, Gtk
+
+# Menu bar labels and their submenu (label, callback) items
+MENU_SPEC = (
+    ("File", (
+        ("Shred file", None),
+        ("Shred folder", None),
+        ("Wipe free space", None),
+        ("Make chaff", None),
+        ("Quit", None),
+    )),
+    ("Edit", (
+        ("Preferences", None),
+    )),
+    ("Help", (
+        ("System information", None),
+        ("Help", None),
+        ("About", None),
+    )),
+)
+
+# Example cleaners, options, and actions for the simulated results. They are
+# interned so every row shares one copy of each string.
+SAMPLE_CLEANERS = tuple(sys.intern(s) for s in ("Chrome", "Firefox", "Edge"))
+SAMPLE_OPTIONS = tuple(sys.intern(s) for s in (
+    "Cache", "History", "Cookies", "Sessions", "Passwords"))
+ACTION_ERROR, ACTION_DELETED, ACTION_SHRED = (
+    sys.intern(s) for s in ("error", "deleted", "shred"))
+
+# Placeholder for a result row that is waiting to be overwritten
+BLANK_RESULT_ROW = ("", "", "", 0, "")
+
+
+class ResultsModel(GObject.Object, Gtk.TreeModel, Gtk.TreeSortable):
+    """List of cleaning results backed by one container per column
+
+    Columns are cleaner, option, filename, file size, and action. Strings
+    are kept in lists and sizes in an array of 64-bit integers. Compared
+    to a Gtk.ListStore, no GValue is kept per cell and repeated names are
+    interned.
+
+    A tree iter holds the row index plus one in its user_data.
+    """
+
+    column_types = (str, str, str, GObject.TYPE_INT64, str)
+    SIZE_COLUMN = 3
+
+    def __init__(self):
+        super().__init__()
+        self._cleaner = []
+        self._option = []
+        self._filename = []
+        self._size = array.array('q')
+        self._action = []
+        self._columns = (self._cleaner, self._option,
+                         self._filename, self._size, self._action)
+        self._sort_column_id = Gtk.TREE_SORTABLE_UNSORTED_SORT_COLUMN_ID
+        self._sort_order = Gtk.SortType.ASCENDING
+
+    def _make_iter(self, index):
+        """Return (True, iter) for the row index or (False, None)"""
+        if not 0 <= index < len(self._filename):
+            return (False, None)
+        tree_iter = Gtk.TreeIter()
+        tree_iter.user_data = index + 1
+        return (True, tree_iter)
+
+    def _sort_key(self, column):
+        """Return a function mapping a value of column to its sort key
+
+        Strings are compared like Gtk.ListStore does, with g_utf8_collate.
+        """
+        if column == self.SIZE_COLUMN:
+            return int
+        return lambda value: GLib.utf8_collate_key(value, -1)
+
+    def _insert_position(self, row):
+        """Return the index where row keeps the current sort order"""
+        if self._sort_column_id < 0:
+            return len(self._filename)
+        sort_key = self._sort_key(self._sort_column_id)
+        keys = self._columns[self._sort_column_id]
+        value = sort_key(row[self._sort_column_id])
+        descending = self._sort_order == Gtk.SortType.DESCENDING
+        low, high = 0, len(keys)
+        while low < high:
+            middle = (low + high) // 2
+            key = sort_key(keys[middle])
+            if (key >= value) if descending else (key <= value):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __len__(self):
+        return len(self._filename)
+
+    @staticmethod
+    def _intern_row(row):
+        """Return the row with its repeated names interned"""
+        cleaner, option, filename, size, action = row
+        return (sys.intern(cleaner), sys.intern(option),
+                filename, size, sys.intern(action))
+
+    def append(self, row):
+        """Add a (cleaner, option, filename, size, action) row"""
+        row = self._intern_row(row)
+        index = self._insert_position(row)
+        for column, value in zip(self._columns, row):
+            column.insert(index, value)
+        self.row_inserted(Gtk.TreePath((index,)), self._make_iter(index)[1])
+
+    def replace_row(self, index, row):
+        """Replace the row at index, ignoring the sort order"""
+        for column, value in zip(self._columns, self._intern_row(row)):
+            column[index] = value
+        self.row_changed(Gtk.TreePath((index,)), self._make_iter(index)[1])
+
+    def truncate(self, n_rows):
+        """Remove all rows after the first n_rows"""
+        for index in reversed(range(n_rows, len(self._filename))):
+            for column in self._columns:
+                del column[index]
+            self.row_deleted(Gtk.TreePath((index,)))
+
+    def clear(self):
+        """Remove all rows"""
+        self.truncate(0)
+
+    def do_get_flags(self):
+        return Gtk.TreeModelFlags.LIST_ONLY
+
+    def do_get_n_columns(self):
+        return len(self.column_types)
+
+    def do_get_column_type(self, n):
+        return self.column_types[n]
+
+    def do_get_iter(self, path):
+        indices = path.get_indices()
+        if len(indices) != 1:
+            return (False, None)
+        return self._make_iter(indices[0])
+
+    def do_get_path(self, tree_iter):
+        return Gtk.TreePath((tree_iter.user_data - 1,))
+
+    def do_get_value(self, tree_iter, column):
+        value = self._columns[column][tree_iter.user_data - 1]
+        if column == self.SIZE_COLUMN:
+            # A bare int would become a 32-bit G_TYPE_INT.
+            return GObject.Value(GObject.TYPE_INT64, value)
+        return value
+
+    def do_iter_next(self, tree_iter):
+        if tree_iter.user_data >= len(self._filename):
+            return False
+        tree_iter.user_data += 1
+        return True
+
+    def do_iter_previous(self, tree_iter):
+        if tree_iter.user_data <= 1:
+            return False
+        tree_iter.user_data -= 1
+        return True
+
+    def do_iter_children(self, parent):
+        if parent is not None:
+            return (False, None)
+        return self._make_iter(0)
+
+    def do_iter_has_child(self, tree_iter):
+        return False
+
+    def do_iter_n_children(self, tree_iter):
+        if tree_iter is not None:
+            return 0
+        return len(self._filename)
+
+    def do_iter_nth_child(self, parent, n):
+        if parent is not None:
+            return (False, None)
+        return self._make_iter(n)
+
+    def do_iter_parent(self, child):
+        return (False, None)
+
+    def do_get_sort_column_id(self):
+        return (self._sort_column_id >= 0, self._sort_column_id, self._sort_order)
+
+    def do_set_sort_column_id(self, sort_column_id, order):
+        self._sort_column_id = sort_column_id
+        self._sort_order = order
+        if sort_column_id >= 0 and self._filename:
+            sort_key = self._sort_key(sort_column_id)
+            keys = [sort_key(value) for value in self._columns[sort_column_id]]
+            new_order = sorted(range(len(keys)), key=keys.__getitem__,
+                               reverse=order == Gtk.SortType.DESCENDING)
+            for column in self._columns:
+                reordered = [column[i] for i in new_order]
+                if isinstance(column, array.array):
+                    reordered = array.array(column.typecode, reordered)
+                column[:] = reordered
+            self.rows_reordered(Gtk.TreePath(), None, new_order)
+        self.sort_column_changed()
+
+    def do_has_default_sort_func(self):
+        return False
 
 
 class BleachBitWindow(Gtk.Window):
@@ -54,33 +261,14 @@ class BleachBitWindow(Gtk.Window):
         """Create a menu bar"""
         menubar = Gtk.MenuBar()
 
-        menu_items = [
-            ("File", [
-                ("Shred file", None),
-                ("Shred folder", None),
-                ("Wipe free space", None),
-                ("Make chaff", None),
-                ("Quit", None),
-            ]),
-            ("Edit", [
-                ("Preferences", None)
-            ]),
-            ("Help", [
-                ("System information", None),
-                ("Help", None),
-                ("About", None)
-            ])
-        ]
-        for label, submenu_items in menu_items:
+        for label, submenu_items in MENU_SPEC:
             menu = Gtk.Menu()
-            for i, (submenu_label, submenu_func) in enumerate(submenu_items):
-                item = Gtk.MenuItem()
-                item.set_label(submenu_label)
+            for submenu_label, submenu_func in submenu_items:
+                item = Gtk.MenuItem.new_with_label(submenu_label)
                 if submenu_func is not None:
                     item.connect("activate", submenu_func)
                 menu.append(item)
-            item = Gtk.MenuItem()
-            item.set_label(label)
+            item = Gtk.MenuItem.new_with_label(label)
             item.set_submenu(menu)
             menubar.append(item)
         vbox.pack_start(menubar, False, False, 0)
@@ -98,16 +286,24 @@ class BleachBitWindow(Gtk.Window):
         self.search_entry = Gtk.Entry(width_chars=20)
         self.search_entry.set_placeholder_text("Search")
         self.search_entry_text = None
+        self.search_needle_casefold = None
+        self._visible_rows = None
+        self._prev_needle = None
+        self._refilter_source_id = 0
+        self._refilter_pending = False
         self.search_entry.connect("changed", self.on_search_entry_changed)
 
         vbox.pack_start(self.search_entry, False, False, 0)
 
-        # Create a TreeView to display the available cleaning options
-        self.treestore_options = Gtk.TreeStore(str, bool)
+        # Create a TreeView to display the available cleaning options.
+        # Columns: label, selected, casefolded label (hidden, for searching),
+        # visible (hidden, read by the filter without calling into Python).
+        self.treestore_options = Gtk.TreeStore(str, bool, str, bool)
         self.treeview_options = Gtk.TreeView(self.treestore_options)
         self.option_filter = self.treestore_options.filter_new()
-        self.option_filter.set_visible_func(self.on_search_changed_filter)
+        self.option_filter.set_visible_column(3)
         self.treeview_options.set_model(self.option_filter)
+        self.treeview_options.connect("map", self.on_options_mapped)
         vbox.pack_start(self.treeview_options, True, True, 0)
 
         # Create columns for the options
@@ -123,49 +319,116 @@ class BleachBitWindow(Gtk.Window):
         selected_column.add_attribute(selected_renderer, "active", 1)
         self.treeview_options.append_column(selected_column)
 
-        # Add some sample data
+        # Add some sample data. Detach the model meanwhile so the view
+        # does not update for every row.
+        self.treeview_options.set_model(None)
         self.populate_options_pane()
+        self.treeview_options.set_model(self.option_filter)
 
         paned.add1(vbox)
 
     def on_search_entry_changed(self, entry):
         """Callback function for user typing in the options search box."""
-        self.search_entry_text = self.search_entry.get_text()
-        self.option_filter.refilter()
+        self.search_entry_text = entry.get_text()
+        # Casefold the search term once here instead of once per row.
+        self.search_needle_casefold = self.search_entry_text.casefold() or None
+        # Wait for a pause in typing, so a burst of keystrokes refilters once.
+        if self._refilter_source_id:
+            GLib.source_remove(self._refilter_source_id)
+        self._refilter_source_id = GLib.timeout_add(100, self._do_refilter)
+
+    def _do_refilter(self):
+        """Refilter the options TreeView after the user stops typing"""
+        self._refilter_source_id = 0
+        if not self.treeview_options.get_mapped():
+            # Nobody can see the options, so catch up when they are shown.
+            self._refilter_pending = True
+            return False
+        self._refilter_pending = False
+        needle = self.search_needle_casefold
+        prev_needle = self._prev_needle
+        prev_visible_rows = self._visible_rows
+        if needle and prev_needle and needle.startswith(prev_needle):
+            # Typing more letters can only hide rows, so check only the
+            # rows that are already visible.
+            self._visible_rows = self._find_visible_rows(
+                needle, prev_visible_rows)
+            for path in prev_visible_rows - self._visible_rows:
+                self.treestore_options.set_value(
+                    self.treestore_options.get_iter_from_string(path), 3, False)
+        else:
+            self._visible_rows = self._find_visible_rows(needle)
+            self._update_visible_column(self._visible_rows)
+        self._prev_needle = needle
+        return False
+
+    def on_options_mapped(self, widget):
+        """Apply a search that was typed while the options were hidden"""
+        if self._refilter_pending:
+            self._do_refilter()
 
-    def on_search_changed_filter(self, model, iter, data):
-        """Callback function for each row in the options TreeView.
+    def _update_visible_column(self, visible_rows):
+        """Write the visible column of the options TreeStore
+
+        The filter notices each changed row by itself, so no refilter is
+        needed. Only rows whose visibility changes are written.
+        """
+        def update_row(model, path, iter):
+            visible = visible_rows is None or path.to_string() in visible_rows
+            if model.get_value(iter, 3) != visible:
+                model.set_value(iter, 3, visible)
+            return False
+        self.treestore_options.foreach(update_row)
 
-        This is called for row to set its visibility.
+    def _find_visible_rows(self, needle, candidate_rows=None):
+        """Return the set of option paths that match the search term
 
-         Logic is as follows:
+        Logic is as follows:
          * If the search box is empty, show all rows.
          * Searches are case insenitive.
          * If the search box matches a child (e.g., cookies, cache), show this child and its parent. This may hide its brothers such searching for "cookie" will hide "cache."
-         * If the search box matches a parent (e.g., Firefox, Chrome), show this parent and all its children. 
+         * If the search box matches a parent (e.g., Firefox, Chrome), show this parent and all its children.
+         * If the search box has several words, in any order (e.g., "cookies firefox"), each word must match the row or its parent.
+
+        This makes one top-down pass over the TreeStore: each row gets a
+        bitmask of the words it or its ancestors contain on the way down
+        and reports whether it or a descendant matched on the way back up.
+        If candidate_rows is given, rows outside it are skipped with their
+        children. Returns None when there is no search.
         """
-
-        current_row = model.get_value(iter, 0)
-        print(f'Search changed filter: {
-              self.search_entry_text} current row: {current_row}')
-        if not self.search_entry_text:
-            return True
-        if current_row.lower().find(self.search_entry_text.lower()) != -1:
-            return True
-
-        parent_iter = model.iter_parent(iter)
-        if parent_iter is not None:
-            parent_name = model.get_value(parent_iter, 0)
-            if parent_name.lower().find(self.search_entry_text.lower()) != -1:
-                return True
-        # If the search box matches a child, show this child and its parent
-        child_iter = model.iter_children(iter)
-        while child_iter is not None:
-            child_name = model.get_value(child_iter, 0)
-            if child_name.lower().find(self.search_entry_text.lower()) != -1:
-                return True
-            child_iter = model.iter_next(child_iter)
-        return False
+        if needle is None:
+            return None
+        # One bit per distinct word. The row must have all of them.
+        term_bits = [(term, 1 << i)
+                     for i, term in enumerate(dict.fromkeys(needle.split()))]
+        all_terms = (1 << len(term_bits)) - 1
+        visible_rows = set()
+        model = self.treestore_options
+
+        def walk(iter, ancestor_mask):
+            """Mark visible rows among iter and its siblings
+
+            Returns whether any of them or their descendants match.
+            """
+            contains_match = False
+            while iter is not None:
+                path_str = model.get_string_from_iter(iter)
+                if candidate_rows is None or path_str in candidate_rows:
+                    # A matching parent shows all its children.
+                    row_mask = ancestor_mask
+                    if row_mask != all_terms:
+                        label = model.get_value(iter, 2)
+                        for term, bit in term_bits:
+                            if term in label:
+                                row_mask |= bit
+                    row_matches = row_mask == all_terms
+                    if walk(model.iter_children(iter), row_mask) or row_matches:
+                        visible_rows.add(path_str)
+                        contains_match = True
+                iter = model.iter_next(iter)
+            return contains_match
+        walk(model.get_iter_first(), 0)
+        return visible_rows
 
     def populate_options_pane(self):
         """Create example cleaners and options
@@ -181,9 +444,11 @@ class BleachBitWindow(Gtk.Window):
             "System": ['Cache', 'Clipboard', 'Custom', 'Logs', 'Temporary files', 'Trash']
         }
         for parent, children in sample_data.items():
-            parent_iter = self.treestore_options.append(None, [parent, True])
+            parent_iter = self.treestore_options.append(
+                None, [parent, True, parent.casefold(), True])
             for child in children:
-                self.treestore_options.append(parent_iter, [child, True])
+                self.treestore_options.append(
+                    parent_iter, [child, True, child.casefold(), True])
 
     def create_toolbar(self, vbox):
         """Create the main toolbar with buttons"""
@@ -240,40 +505,51 @@ class BleachBitWindow(Gtk.Window):
         scrolled.add(self.treeview)
         vbox.pack_start(scrolled, True, True, 0)
 
-        # Create a ListStore to hold the data
-        self.liststore = Gtk.ListStore(str, str, str, int, str)
-        self.treeview.set_model(self.liststore)
+        # Create a model to hold the data
+        self.results_model = ResultsModel()
+        self._populate_source_id = 0
+        self._results_written = 0
+        self.treeview.set_model(self.results_model)
 
         # Create columns: cleaner, option, filename, file size, action.
+        # Sorting is turned on for a column only when the user first clicks
+        # its header, so filling the list does not pay for sorted inserts.
         renderer = Gtk.CellRendererText()
-        column = Gtk.TreeViewColumn("Cleaner", renderer, text=0)
-        column.set_sort_column_id(0)
-        self.treeview.append_column(column)
-
-        column = Gtk.TreeViewColumn("Option", renderer, text=1)
-        column.set_sort_column_id(1)
-        self.treeview.append_column(column)
-
-        column = Gtk.TreeViewColumn("Filename", renderer, text=2)
-        column.set_sort_column_id(2)
-        self.treeview.append_column(column)
-
-        column = Gtk.TreeViewColumn("File size (B)", renderer, text=3)
-        column.set_sort_column_id(3)
-        self.treeview.append_column(column)
-
-        column = Gtk.TreeViewColumn("Action", renderer, text=4)
-        column.set_sort_column_id(4)
-        self.treeview.append_column(column)
+        titles = ("Cleaner", "Option", "Filename", "File size (B)", "Action")
+        for i, title in enumerate(titles):
+            column = Gtk.TreeViewColumn(title, renderer, text=i)
+            column.set_clickable(True)
+            column.connect("clicked", self._enable_sort, i)
+            self.treeview.append_column(column)
 
         # Allow user to seelct multple rows for whitelisting.
-        self.treeview.get_selection().set_mode(Gtk.SelectionMode.MULTIPLE)
+        self._results_selection = self.treeview.get_selection()
+        self._results_selection.set_mode(Gtk.SelectionMode.MULTIPLE)
+        self._results_selection.set_select_function(self._can_select_result)
 
         # Add a context menu.
         self.treeview.connect("button-press-event",
                               self.on_file_result_context_menu)
 
-        self.treeview.get_selection().connect("changed", self.on_selection_changed)
+        self._results_selection.connect("changed", self.on_selection_changed)
+
+    def _can_select_result(self, selection, model, path, path_currently_selected):
+        """Allow selecting only rows that the current run has written"""
+        return (path_currently_selected or not self._populate_source_id
+                or path.get_indices()[0] < self._results_written)
+
+    def _enable_sort(self, column, sort_column_id):
+        """Make a results column sortable on the first click of its header"""
+        column.disconnect_by_func(self._enable_sort)
+        if self._populate_source_id:
+            # A run writes over old rows by position, which sorting would
+            # shuffle. Drop the old rows not yet overwritten while positions
+            # still hold, so the rest of the run appends in sorted order.
+            self.results_model.truncate(self._results_written)
+        column.set_sort_column_id(sort_column_id)
+        # GTK handles later clicks, but this one still needs to sort.
+        self.results_model.set_sort_column_id(
+            sort_column_id, Gtk.SortType.ASCENDING)
 
     def on_selection_changed(self, selection):
         """Enable whitelist button on toolbar when 1+ rows are selected"""
@@ -281,93 +557,153 @@ class BleachBitWindow(Gtk.Window):
         sensitive = len(paths) > 0
         self.whitelist_button.set_sensitive(sensitive)
 
-    def on_copy_path_activated(self, widget, filename):
-        """Copy filename to clipboard"""
+    def on_copy_path_activated(self, widget, filenames):
+        """Copy filenames to clipboard, one per line"""
         from gi.repository import Gdk
         clipboard = Gtk.Clipboard.get(Gdk.SELECTION_CLIPBOARD)
-        clipboard.set_text(filename, -1)
+        clipboard.set_text("\n".join(filenames), -1)
+
+    def on_open_file_location(self, widget, filenames):
+        """Open the folders containing the files in the file manager"""
+        dirnames = dict.fromkeys(os.path.dirname(f) for f in filenames)
+        for dirname in dirnames:
+            try:
+                Gtk.show_uri_on_window(
+                    self, GLib.filename_to_uri(dirname), Gtk.get_current_event_time())
+            except GLib.Error as e:
+                print(f"Cannot open {dirname}: {e.message}")
 
     def on_file_result_context_menu(self, widget, event):
         """Show a context menu for file result"""
         # 3 is the right mouse button
         if not event.button == 3:
             return
-        selection = self.treeview.get_selection()
-        model, pathlist = selection.get_selected_rows()
-        for path in pathlist:
-            tree_iter = model.get_iter(path)
-            filename = model.get_value(tree_iter, 2)
-            menu = Gtk.Menu()
-            copy_path_item = Gtk.MenuItem.new_with_label("Copy path")
-            copy_path_item.connect(
-                "activate", self.on_copy_path_activated, filename)
-            menu.append(copy_path_item)
-            open_file_location_item = Gtk.MenuItem.new_with_label(
-                "Open file location")
-            copy_path_item.connect(
-                "activate", self.on_copy_path_activated, filename)
-
-            menu.append(open_file_location_item)
-            whitelist_item = Gtk.MenuItem.new_with_label("Whitelist")
-            # whitelist_item.connect("activate", self.on_whitelist_activated, filename)
-            menu.append(whitelist_item)
-            menu.show_all()
-            menu.popup(None, None, None, None, event.button, event.time)
+        model, pathlist = self._results_selection.get_selected_rows()
+        if not pathlist:
+            return
+        # One menu acts on the whole selection.
+        filenames = [model.get_value(model.get_iter(path), 2)
+                     for path in pathlist]
+        menu = Gtk.Menu()
+        copy_path_item = Gtk.MenuItem.new_with_label("Copy path")
+        copy_path_item.connect(
+            "activate", self.on_copy_path_activated, filenames)
+        menu.append(copy_path_item)
+        open_file_location_item = Gtk.MenuItem.new_with_label(
+            "Open file location")
+        open_file_location_item.connect(
+            "activate", self.on_open_file_location, filenames)
+        menu.append(open_file_location_item)
+        whitelist_item = Gtk.MenuItem.new_with_label("Whitelist")
+        # whitelist_item.connect("activate", self.on_whitelist_activated, filenames)
+        menu.append(whitelist_item)
+        menu.show_all()
+        menu.popup(None, None, None, None, event.button, event.time)
 
     def populate_data(self, is_delete=True):
-        """Launch a thread to populate the data"""
-        thread = threading.Thread(
-            target=self._populate_data, args=(is_delete,))
-        thread.start()
-
-    def _populate_data(self, is_delete=True):
-        """In background thread, populate the data"""
-        self.abort_button.set_sensitive(True)
+        """Start adding the data from the main loop"""
+        # Stop a previous run that is still adding rows.
+        if self._populate_source_id:
+            GLib.source_remove(self._populate_source_id)
         num_files = random.randint(5, 50)
+        # Overwrite the previous results in place, instead of deleting every
+        # row first, and trim the rows this run will not reach right away.
+        # A sorted list is cleared, because overwriting would break its order.
+        if self.results_model.get_sort_column_id()[0]:
+            self.results_model.clear()
+        else:
+            self.results_model.truncate(num_files)
+        self._results_selection.unselect_all()
+        # Blank the rows that are left, so results of the previous run are
+        # not mistaken for new ones before they are overwritten.
+        for index in range(len(self.results_model)):
+            self.results_model.replace_row(index, BLANK_RESULT_ROW)
+        self._results_written = 0
+        self.abort_button.set_sensitive(True)
+        self._populate_source_id = GLib.idle_add(
+            self._pump_rows, self._populate_data(num_files, is_delete), None,
+            priority=GLib.PRIORITY_DEFAULT_IDLE)
+
+    def _pump_rows(self, rows, row):
+        """Add one row, then schedule the next after its simulated delay
+
+        Each row is shown as soon as its delay is over, so progress is
+        visible while the run goes on.
+        """
+        if row is not None:
+            self._write_row(row)
+        try:
+            delay_sec, row = next(rows)
+        except StopIteration:
+            self._populate_source_id = 0
+            self.abort_button.set_sensitive(False)
+            return False
+        self._populate_source_id = GLib.timeout_add(
+            int(delay_sec * 1000), self._pump_rows, rows, row)
+        return False
+
+    def _write_row(self, row):
+        """Write a row over the next old result, or append it past the end"""
+        model = self.results_model
+        if self._results_written < len(model):
+            # Do not let a selection carry over to the new file.
+            self._results_selection.unselect_path(
+                Gtk.TreePath((self._results_written,)))
+            model.replace_row(self._results_written, row)
+        else:
+            model.append(row)
+        self._results_written += 1
+
+    def _populate_data(self, num_files, is_delete=True):
+        """Generate num_files rows of data as (delay in seconds, row) pairs"""
+        home = os.path.expanduser("~")
+        config_dir = os.path.join(home, ".config")
+        cache_dir = os.path.join(home, ".cache")
+        # Draw all the random values up front instead of several calls per file.
+        cleaner_names = random.choices(SAMPLE_CLEANERS, k=num_files)
+        option_names = random.choices(SAMPLE_OPTIONS, k=num_files)
+        file_numbers = random.choices(range(101), k=num_files)
+        sizes = random.choices(range(10001), k=num_files)
+        result_randoms = [random.random() for _ in range(num_files)]
+        sleep_times_sec = [random.uniform(0.01, 0.2) for _ in range(num_files)]
         for i in range(num_files):
-            cleaner_name = random.choice(["Chrome", "Firefox", "Edge"])
-            option_name = random.choice(
-                ["Cache", "History", "Cookies", "Sessions", "Passwords"])
-            filename = os.path.join(os.path.expanduser(
-                "~"), ".config", cleaner_name, option_name, str(random.randint(0, 100)))
+            cleaner_name = cleaner_names[i]
+            option_name = option_names[i]
             if option_name == 'Cache':
-                filename = os.path.join(os.path.expanduser(
-                    "~"), ".cache", cleaner_name, str(random.randint(0, 100)))
-            size = random.randint(0, 10000)
-            result_random = random.random()
+                filename = os.path.join(
+                    cache_dir, cleaner_name, str(file_numbers[i]))
+            else:
+                filename = os.path.join(
+                    config_dir, cleaner_name, option_name, str(file_numbers[i]))
+            size = sizes[i]
+            result_random = result_randoms[i]
             if is_delete:
                 if result_random < 0.05:
-                    result = "error"
+                    result = ACTION_ERROR
                 elif result_random < 0.15:
-                    result = "deleted"
+                    result = ACTION_DELETED
                 else:
-                    result = "shred"
+                    result = ACTION_SHRED
             else:
                 result = ""
 
-            # Sleep simulates waiting for disk I/O.
-            sleep_time_sec = random.uniform(0.01, 0.2)
+            # The delay simulates waiting for disk I/O.
+            sleep_time_sec = sleep_times_sec[i]
             if not is_delete:
                 sleep_time_sec = sleep_time_sec/10
-            time.sleep(sleep_time_sec)
-            self.liststore.append(
-                [cleaner_name, option_name, filename, size, result])
-        self.abort_button.set_sensitive(False)
+            yield sleep_time_sec, [cleaner_name, option_name, filename, size, result]
 
     def on_preview_clicked(self, button):
-        # Clear the previous cleaning results and populate a new list of files
-        self.liststore.clear()
+        # Replace the previous cleaning results with a new list of files
         self.populate_data(is_delete=False)
 
     def on_clean_clicked(self, button):
-        # Clear the previous cleaning results and populate a new list of files
-        self.liststore.clear()
+        # Replace the previous cleaning results with a new list of files
         self.populate_data(is_delete=True)
 
     def on_whitelist_clicked(self, button):
         # Get the selected rows
-        selection = self.treeview.get_selection()
-        model, paths = selection.get_selected_rows()
+        model, paths = self._results_selection.get_selected_rows()
         for path in paths:
             # Get the filename
             filename = model[path][2]